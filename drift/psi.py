@@ -0,0 +1,95 @@
+import numpy as np
+from typing import Dict, Sequence, Tuple
+
+# Conventional PSI reading: < 0.1 stable, 0.1-0.25 moderate shift, > 0.25 significant shift
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+_EPSILON = 1e-6  # Floor for empty bins so the log term stays finite
+
+
+def _bin_counts(expected: np.ndarray, actual: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bin both samples on cuts taken from the baseline.
+
+    A baseline with at most `bins` distinct values (flags, small counts) gets one
+    bin per value; otherwise bins are cut on baseline quantiles. Either way values
+    below or above the baseline's range get their own bins, so a shift past the
+    baseline is never folded into a bin that already holds baseline mass.
+    """
+    distinct = np.unique(expected)
+    low, high = distinct[0], distinct[-1]
+
+    if len(distinct) <= bins:
+        n_inner = len(distinct)
+
+        def assign(values: np.ndarray) -> np.ndarray:
+            pos = np.minimum(np.searchsorted(distinct, values), n_inner - 1)
+            return np.where(distinct[pos] == values, pos, n_inner + 2)  # Last bin: unseen value inside the range
+    else:
+        # Interior quantile edges; ties collapse, so fewer than `bins` bins is possible
+        edges = np.unique(np.quantile(expected, np.linspace(0, 1, bins + 1))[1:-1])
+        n_inner = len(edges) + 1
+
+        def assign(values: np.ndarray) -> np.ndarray:
+            return np.searchsorted(edges, values, side="right")
+
+    def counts(values: np.ndarray) -> np.ndarray:
+        idx = assign(values)
+        idx = np.where(values < low, n_inner, idx)
+        idx = np.where(values > high, n_inner + 1, idx)
+        return np.bincount(idx, minlength=n_inner + 3)
+
+    return counts(expected), counts(actual)
+
+
+def population_stability_index(expected: Sequence[float], actual: Sequence[float], bins: int = 10) -> float:
+    """
+    Population Stability Index of `actual` against the `expected` baseline.
+
+    Args:
+        expected: Baseline sample of a numeric feature
+        actual: Current sample of the same feature
+        bins: Number of quantile bins, cut on the baseline (or the maximum number
+            of distinct baseline values binned individually)
+
+    Returns:
+        PSI value (0 means identical binned distributions)
+    """
+    expected = np.asarray(expected, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    if expected.size == 0 or actual.size == 0:
+        raise ValueError("PSI needs non-empty expected and actual samples")
+    if bins < 1:
+        raise ValueError(f"bins must be at least 1, got {bins}")
+
+    expected_pct, actual_pct = _bin_counts(expected, actual, bins)
+    expected_pct = np.maximum(expected_pct / expected.size, _EPSILON)
+    actual_pct = np.maximum(actual_pct / actual.size, _EPSILON)
+    return float(np.sum((actual_pct - expected_pct) * np.log(actual_pct / expected_pct)))
+
+
+def psi_by_field(baseline: Sequence[Dict], current: Sequence[Dict], fields: Sequence[str], bins: int = 10) -> Dict[str, float]:
+    """PSI for each numeric field across two batches of records; None values are skipped."""
+    result = {}
+    for field in fields:
+        expected = [r[field] for r in baseline if r.get(field) is not None]
+        actual = [r[field] for r in current if r.get(field) is not None]
+        result[field] = population_stability_index(expected, actual, bins)
+    return result
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    baseline = rng.beta(2, 8, size=10000)
+
+    print("=== Testing PSI ===")
+    print(f"Same distribution: {population_stability_index(baseline, rng.beta(2, 8, size=10000)):.4f}")
+    print(f"Moderate shift: {population_stability_index(baseline, rng.beta(2.5, 8, size=10000)):.4f}")
+    print(f"Significant shift: {population_stability_index(baseline, rng.beta(4, 6, size=10000)):.4f}")
+    print(f"Constant baseline, shifted up: {population_stability_index([1] * 100, [2] * 100):.4f}")
+    print(f"Boolean flag False -> True: {population_stability_index([0] * 100, [1] * 100):.4f}")
+    print(f"Boolean flag True -> False: {population_stability_index([1] * 100, [0] * 100):.4f}")
+    print(f"Boolean flag, same rate: {population_stability_index([0] * 95 + [1] * 5, [1] * 5 + [0] * 95):.4f}")
+    print(f"Counts all moved to top value: {population_stability_index([0] * 95 + [1] * 5, [1] * 100):.4f}")
@@ -0,0 +1,3 @@
+"""Synthetic edge case fraud data generator command line tools."""
+
+__version__ = "0.1.0"
@@ -0,0 +1,5 @@
+import sys
+
+from fraudgen.cli import main
+
+sys.exit(main())
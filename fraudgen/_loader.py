@@ -0,0 +1,47 @@
+import os
+import sys
+import types
+from importlib.machinery import ModuleSpec, SourceFileLoader
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Installed, the subsystem sources live inside the package (see package-dir in
+# pyproject.toml); in a source checkout they sit at the repository root.
+_ROOT = _PACKAGE_DIR if os.path.isdir(os.path.join(_PACKAGE_DIR, "schema")) else os.path.dirname(_PACKAGE_DIR)
+
+# Subsystem name -> source file. Several files have hyphenated names and
+# cannot be imported normally, so they are loaded by path on first use.
+SUBSYSTEMS = {
+    "fraud_parameters": os.path.join("schema", "fraud-paramters.py"),
+    "fraud_patterns": os.path.join("schema", "fraud-patterns.py"),
+    "account_opening_schema": os.path.join("schema", "account-opening-schema.py"),
+    "constraints": os.path.join("schema", "constraints.py"),
+    "hard_constraints": os.path.join("validation", "hard_constraints.py"),
+    "ip_pool": os.path.join("generation", "ip_pool.py"),
+    "psi": os.path.join("drift", "psi.py"),
+}
+
+
+def load(name: str):
+    """Load a subsystem module by name, executing it at most once per process."""
+    module_name = f"fraudgen._subsystems.{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    if name not in SUBSYSTEMS:
+        raise ValueError(f"Unknown subsystem: {name}")
+
+    # Built from importlib.machinery directly; importlib.util would pull in
+    # contextlib and friends on every short CLI run.
+    path = os.path.join(_ROOT, SUBSYSTEMS[name])
+    loader = SourceFileLoader(module_name, path)
+    module = types.ModuleType(module_name)
+    module.__file__ = path
+    module.__loader__ = loader
+    module.__spec__ = ModuleSpec(module_name, loader, origin=path)
+    # Registered before exec so dataclasses and pickling can resolve the module
+    sys.modules[module_name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,225 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+CLUSTERING_PARAM = "network_patterns.ip_subnet_clustering"
+PROXY_PARAM = "network_patterns.proxy_vpn_usage_rate"
+
+# Record sources
+SOURCE_BACKGROUND = 0    # Scattered residential-looking address
+SOURCE_CLUSTER = 1       # Campaign's home /24 (IPv4) or /64 (IPv6)
+SOURCE_PROXY = 2         # Campaign's proxy/VPN pool
+
+# First octets that are private, loopback, CGNAT, link-local, documentation or multicast
+_RESERVED_FIRST_OCTETS = {0, 10, 100, 127, 169, 172, 192, 198, 203}
+_PUBLIC_FIRST_OCTETS = np.array(
+    [octet for octet in range(1, 224) if octet not in _RESERVED_FIRST_OCTETS], dtype=np.uint64
+)
+
+# Private-use ASN range (RFC 6996), so synthetic proxy providers never collide with real ones
+_PRIVATE_ASN_RANGE = (64512, 65534)
+
+_IPV4_FORMAT = "%d.%d.%d.%d"
+_IPV6_FORMAT = ":".join(["%x"] * 8)  # Uncompressed, as HardConstraintValidator's ip_v6 check expects
+
+
+@dataclass
+class CampaignIPPool:
+    """Subnets and proxy ASNs reserved for one campaign.
+
+    Networks are integer prefixes: the top 24 bits of an IPv4 address or the
+    top 64 bits of an IPv6 address.
+    """
+    campaign_id: str
+    ip_version: int
+    clustering_fraction: float
+    proxy_rate: float
+    cluster_subnets: np.ndarray
+    proxy_subnets: np.ndarray
+    proxy_asns: np.ndarray
+
+
+@dataclass
+class IPSample:
+    """Addresses drawn from a campaign pool, kept as integer arrays until output."""
+    ip_version: int
+    network: np.ndarray
+    host: np.ndarray
+    source: np.ndarray
+    asn: np.ndarray  # 0 unless the record came from the proxy pool
+
+    def __len__(self) -> int:
+        return len(self.network)
+
+    def to_strings(self) -> List[str]:
+        """Format addresses as strings accepted by HardConstraintValidator."""
+        if self.ip_version == 4:
+            parts = np.stack([
+                (self.network >> 16) & 0xFF,
+                (self.network >> 8) & 0xFF,
+                self.network & 0xFF,
+                self.host,
+            ], axis=1)
+            fmt = _IPV4_FORMAT
+        else:
+            shifts = np.array([48, 32, 16, 0], dtype=np.uint64)
+            parts = np.concatenate([
+                (self.network[:, None] >> shifts) & 0xFFFF,
+                (self.host[:, None] >> shifts) & 0xFFFF,
+            ], axis=1)
+            fmt = _IPV6_FORMAT
+        return [fmt % tuple(row) for row in parts.tolist()]
+
+
+class IPPoolSampler:
+    def __init__(self,
+                 clustering_range: Tuple[float, float] = (0.0, 0.0),
+                 proxy_range: Tuple[float, float] = (0.0, 0.0),
+                 ip_version: int = 4,
+                 cluster_subnet_count: int = 1,
+                 proxy_subnet_count: int = 8,
+                 proxy_asn_count: int = 3,
+                 seed: Optional[int] = None):
+        """
+        Vectorized IP address sampler with per-campaign subnet and proxy pools.
+
+        Args:
+            clustering_range: (min, max) fraction of records drawn from the campaign's home subnets
+            proxy_range: (min, max) fraction of records drawn from the campaign's proxy/VPN pool
+            ip_version: 4 or 6
+            cluster_subnet_count: Number of home /24 (or /64) subnets per campaign
+            proxy_subnet_count: Number of proxy subnets per campaign
+            proxy_asn_count: Number of distinct ASNs the proxy subnets are spread over
+            seed: Seed for the underlying numpy Generator
+        """
+        if ip_version not in (4, 6):
+            raise ValueError(f"Unsupported IP version: {ip_version}")
+        for name, (low, high) in (("clustering_range", clustering_range), ("proxy_range", proxy_range)):
+            if not 0.0 <= low <= high <= 1.0:
+                raise ValueError(f"{name} must satisfy 0 <= min <= max <= 1, got {(low, high)}")
+        if cluster_subnet_count < 1 or proxy_subnet_count < 1 or proxy_asn_count < 1:
+            raise ValueError("Subnet and ASN counts must be at least 1")
+        if proxy_asn_count > proxy_subnet_count:
+            raise ValueError(f"proxy_asn_count ({proxy_asn_count}) cannot exceed "
+                             f"proxy_subnet_count ({proxy_subnet_count})")
+
+        self.clustering_range = clustering_range
+        self.proxy_range = proxy_range
+        self.ip_version = ip_version
+        self.cluster_subnet_count = cluster_subnet_count
+        self.proxy_subnet_count = proxy_subnet_count
+        self.proxy_asn_count = proxy_asn_count
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_param_ranges(cls, param_ranges: Dict[str, Tuple[float, float]], **kwargs) -> "IPPoolSampler":
+        """Build a sampler from get_all_pattern_params() output; missing parameters mean 0%."""
+        return cls(
+            clustering_range=param_ranges.get(CLUSTERING_PARAM, (0.0, 0.0)),
+            proxy_range=param_ranges.get(PROXY_PARAM, (0.0, 0.0)),
+            **kwargs
+        )
+
+    def _random_networks(self, size: int) -> np.ndarray:
+        """Draw public /24 (IPv4) or global unicast /64 (IPv6) network prefixes."""
+        if self.ip_version == 4:
+            first = self.rng.choice(_PUBLIC_FIRST_OCTETS, size=size)
+            rest = self.rng.integers(0, 1 << 16, size=size, dtype=np.uint64)
+            return (first << np.uint64(16)) | rest
+        # 2000::/3 global unicast
+        return self.rng.integers(0, 1 << 61, size=size, dtype=np.uint64) | np.uint64(1 << 61)
+
+    def _random_hosts(self, size: int) -> np.ndarray:
+        if self.ip_version == 4:
+            return self.rng.integers(1, 255, size=size, dtype=np.uint64)  # Skip .0 and .255
+        return self.rng.integers(1, np.iinfo(np.uint64).max, size=size, dtype=np.uint64, endpoint=True)
+
+    def allocate(self, campaign_id: str) -> CampaignIPPool:
+        """Reserve home subnets and a proxy pool for a campaign and fix its tier rates."""
+        asn_low, asn_high = _PRIVATE_ASN_RANGE
+        asn_ids = self.rng.choice(np.arange(asn_low, asn_high + 1, dtype=np.uint32),
+                                  size=self.proxy_asn_count, replace=False)
+        return CampaignIPPool(
+            campaign_id=campaign_id,
+            ip_version=self.ip_version,
+            clustering_fraction=float(self.rng.uniform(*self.clustering_range)),
+            proxy_rate=float(self.rng.uniform(*self.proxy_range)),
+            cluster_subnets=self._random_networks(self.cluster_subnet_count),
+            proxy_subnets=self._random_networks(self.proxy_subnet_count),
+            # Round-robin then shuffle, so every ASN owns at least one proxy subnet
+            proxy_asns=asn_ids[self.rng.permutation(np.arange(self.proxy_subnet_count) % self.proxy_asn_count)],
+        )
+
+    def sample(self, pool: CampaignIPPool, n: int) -> IPSample:
+        """
+        Draw n addresses for a campaign.
+
+        Exactly round(clustering_fraction * n) records come from the home subnets.
+        Proxy records are taken from the remainder, so clustering wins when the
+        two rates together exceed 100%. Everything else is scattered background.
+        """
+        if pool.ip_version != self.ip_version:
+            raise ValueError(f"Pool {pool.campaign_id} is IPv{pool.ip_version}, sampler is IPv{self.ip_version}")
+
+        n_cluster = int(round(pool.clustering_fraction * n))
+        n_proxy = min(int(round(pool.proxy_rate * n)), n - n_cluster)
+
+        source = np.full(n, SOURCE_BACKGROUND, dtype=np.uint8)
+        source[:n_cluster] = SOURCE_CLUSTER
+        source[n_cluster:n_cluster + n_proxy] = SOURCE_PROXY
+        self.rng.shuffle(source)
+
+        network = self._random_networks(n)
+        asn = np.zeros(n, dtype=np.uint32)
+
+        cluster_mask = source == SOURCE_CLUSTER
+        network[cluster_mask] = pool.cluster_subnets[
+            self.rng.integers(0, len(pool.cluster_subnets), size=n_cluster)
+        ]
+
+        proxy_mask = source == SOURCE_PROXY
+        proxy_idx = self.rng.integers(0, len(pool.proxy_subnets), size=n_proxy)
+        network[proxy_mask] = pool.proxy_subnets[proxy_idx]
+        asn[proxy_mask] = pool.proxy_asns[proxy_idx]
+
+        return IPSample(
+            ip_version=self.ip_version,
+            network=network,
+            host=self._random_hosts(n),
+            source=source,
+            asn=asn,
+        )
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import importlib.util
+    import sys
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parent.parent
+    spec = importlib.util.spec_from_file_location("fraud_parameters", root / "schema" / "fraud-paramters.py")
+    fraud_parameters = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fraud_parameters)
+    sys.path.insert(0, str(root / "validation"))
+    from hard_constraints import HardConstraintValidator, FieldType
+
+    validator = HardConstraintValidator()
+
+    for pattern in ["account_farming", "synthetic_identity", "sophisticated_evasion"]:
+        for version in (4, 6):
+            sampler = IPPoolSampler.from_param_ranges(
+                fraud_parameters.get_all_pattern_params(pattern), ip_version=version, seed=7
+            )
+            pool = sampler.allocate(f"{pattern}-v{version}")
+            sample = sampler.sample(pool, 10000)
+            ips = sample.to_strings()
+
+            _, counts = np.unique(sample.network, return_counts=True)
+            valid = sum(validator.validate_field_type(ip, FieldType.IP_ADDRESS) for ip in ips)
+            print(f"=== {pattern} (IPv{version}) ===")
+            print(f"Target clustering: {pool.clustering_fraction:.2%}, proxy: {pool.proxy_rate:.2%}")
+            print(f"Top subnet share: {counts.max() / len(sample):.2%}")
+            print(f"Proxy share: {np.mean(sample.source == SOURCE_PROXY):.2%}, ASNs: {np.unique(pool.proxy_asns)}")
+            print(f"Examples: {ips[:3]}")
+            print(f"Valid ip_address: {valid}/{len(ips)}")